@@ -24,6 +24,7 @@ Format:
 """
 
 import logging
+from functools import lru_cache
 from typing import Any
 
 import yaml
@@ -31,6 +32,7 @@ import yaml
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
 def parse_frontmatter(form_content: str) -> tuple[dict[str, Any], str]:
     """Parse YAML frontmatter from a form definition string.
 
@@ -38,6 +40,9 @@ def parse_frontmatter(form_content: str) -> tuple[dict[str, Any], str]:
     remaining markdown body. If no frontmatter is found, returns
     an empty dict and the full content unchanged.
 
+    Results are memoized per form text, so the returned dict is shared
+    between callers and must be treated as read-only.
+
     Args:
         form_content: The full form definition (frontmatter + markdown).
 
@@ -6,9 +6,10 @@ into a runnable graph. Models the conversation flow as an explicit,
 inspectable state machine.
 
 Flow:
-    START -> route_input -> {greeting, tool_handler, validate_input,
-                             extraction, conversation}
+    START -> route_input -> {greeting, form_complete, tool_handler,
+                             validate_input, extraction, conversation}
     greeting     -> END
+    form_complete -> END
     tool_handler -> conversation -> finalize -> END
     validate     -> conversation -> finalize -> END
     extraction   -> {conversation, finalize} (conditional)
@@ -17,6 +18,7 @@ Flow:
 """
 
 import logging
+from functools import lru_cache
 from typing import Any
 
 from langgraph.graph import END, START, StateGraph
@@ -24,6 +26,7 @@ from langgraph.graph import END, START, StateGraph
 from backend.agent.nodes.conversation import conversation_node
 from backend.agent.nodes.extraction import extraction_node
 from backend.agent.nodes.finalize import finalize_node
+from backend.agent.nodes.form_complete import form_complete_node
 from backend.agent.nodes.greeting import greeting_node
 from backend.agent.nodes.step_confirmation import step_confirmation_node
 from backend.agent.nodes.tool_handler import tool_handler_node
@@ -49,10 +52,11 @@ def route_input(state: FormPilotState) -> str:
 
     Routing priority:
     1. New session with empty message -> greeting
-    2. Tool results present -> tool_handler
-    3. Pending field + user answer (no tool results) -> validate_input
-    4. First real message, no extraction yet -> extraction
-    5. Default -> conversation
+    2. Form already complete, no new input -> form_complete
+    3. Tool results present -> tool_handler
+    4. Pending field + user answer (no tool results) -> validate_input
+    5. First real message, no extraction yet -> extraction
+    6. Default -> conversation
     """
     user_message = state.get("user_message", "")
     tool_results = state.get("tool_results")
@@ -65,6 +69,10 @@ def route_input(state: FormPilotState) -> str:
     if not conversation_history and not user_message.strip():
         return "greeting"
 
+    # Form already complete and nothing new to act on — replay the result
+    if state.get("completed_action") and not tool_results and not user_message.strip():
+        return "form_complete"
+
     # Tool results from frontend — process them first
     if tool_results:
         return "tool_handler"
@@ -137,10 +145,12 @@ def build_graph() -> StateGraph:
     graph.add_node("extraction", extraction_node)
     graph.add_node("conversation", conversation_node)
     graph.add_node("finalize", finalize_node)
+    graph.add_node("form_complete", form_complete_node)
 
     # Entry point: route based on input
     graph.add_conditional_edges(START, route_input, {
         "greeting": "greeting",
+        "form_complete": "form_complete",
         "tool_handler": "tool_handler",
         "step_confirmation": "step_confirmation",
         "validate_input": "validate_input",
@@ -151,6 +161,9 @@ def build_graph() -> StateGraph:
     # Greeting returns directly — no further processing needed
     graph.add_edge("greeting", END)
 
+    # Completed forms replay their result without calling the LLM
+    graph.add_edge("form_complete", END)
+
     # Tool handler and validation always feed into conversation
     graph.add_edge("tool_handler", "conversation")
     graph.add_conditional_edges("step_confirmation", route_after_step_confirmation, {
@@ -196,6 +209,30 @@ def compile_graph(checkpointer: Any | None = None):
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=32)
+def _parse_form_metadata(form_context_md: str) -> dict[str, Any]:
+    """Parse the field metadata the graph tracks from a form definition.
+
+    Memoized: every session for the same form parses the same text.
+    The result is shared, so create_initial_state() copies it into each
+    new session's state.
+    """
+    frontmatter, _ = parse_frontmatter(form_context_md)
+    required_by_step = get_required_fields_by_step(frontmatter) if frontmatter else {}
+    if required_by_step:
+        max_step = max(required_by_step.keys())
+    else:
+        max_step = 1
+
+    return {
+        "required_fields": extract_required_field_ids(form_context_md),
+        "required_fields_by_step": required_by_step,
+        "field_prompt_map": get_field_prompt_map(frontmatter) if frontmatter else {},
+        "field_types": extract_field_type_map(form_context_md),
+        "max_step": max_step,
+    }
+
+
 def create_initial_state(
     form_context_md: str,
     llm: Any,
@@ -212,12 +249,7 @@ def create_initial_state(
     Returns:
         A fully initialized FormPilotState dict.
     """
-    frontmatter, _ = parse_frontmatter(form_context_md)
-    required_by_step = get_required_fields_by_step(frontmatter) if frontmatter else {}
-    if required_by_step:
-        max_step = max(required_by_step.keys())
-    else:
-        max_step = 1
+    form_metadata = _parse_form_metadata(form_context_md)
 
     return FormPilotState(
         form_context_md=form_context_md,
@@ -226,28 +258,42 @@ def create_initial_state(
         tool_results=None,
         answers={},
         conversation_history=[],
-        required_fields=extract_required_field_ids(form_context_md),
-        required_fields_by_step=required_by_step,
-        field_prompt_map=get_field_prompt_map(frontmatter) if frontmatter else {},
-        field_types=extract_field_type_map(form_context_md),
+        required_fields=list(form_metadata["required_fields"]),
+        required_fields_by_step={
+            step: list(fields)
+            for step, fields in form_metadata["required_fields_by_step"].items()
+        },
+        field_prompt_map=dict(form_metadata["field_prompt_map"]),
+        field_types=dict(form_metadata["field_types"]),
         initial_extraction_done=False,
         current_step=1,
-        max_step=max_step,
+        max_step=form_metadata["max_step"],
         completed_steps=[],
         awaiting_step_confirmation=False,
         allow_answered_field_update=False,
         pending_field_id=None,
         pending_action_type=None,
+        pending_options=None,
         pending_text_value=None,
         pending_text_field_id=None,
         pending_tool_name=None,
         action={},
+        completed_action=None,
         parsed_llm_response=None,
         user_message_added=False,
         skip_conversation_turn=False,
     )
 
 
+# Ephemeral per-turn fields, reset before every graph invocation
+_TURN_RESETS: dict[str, Any] = {
+    "parsed_llm_response": None,
+    "user_message_added": False,
+    "skip_conversation_turn": False,
+    "allow_answered_field_update": False,
+}
+
+
 def prepare_turn_input(
     state: FormPilotState,
     user_message: str,
@@ -266,12 +312,14 @@ def prepare_turn_input(
     Returns:
         Updated state ready for graph invocation.
     """
-    updated = dict(state)
-    updated["user_message"] = user_message
-    updated["tool_results"] = tool_results
-    updated["action"] = {}
-    updated["parsed_llm_response"] = None
-    updated["user_message_added"] = False
-    updated["skip_conversation_turn"] = False
-    updated["allow_answered_field_update"] = False
-    return FormPilotState(**updated)
+    updated: FormPilotState = {
+        **state,
+        **_TURN_RESETS,
+        "user_message": user_message,
+        "tool_results": tool_results,
+        "action": {},
+    }
+    if user_message.strip() or tool_results:
+        # New input may change the answers; finalize re-records completion
+        updated["completed_action"] = None
+    return updated
@@ -0,0 +1,92 @@
+"""
+Exact-match cache for parsed LLM responses.
+
+With temperature 0 the model is deterministic for a given message list,
+so replaying a previously validated response skips the network round-trip
+entirely. This pays off for retries, idempotent re-sends, and the opening
+turns that many sessions for the same form share.
+
+The cache is keyed by a hash of the full message list plus the guard
+context used by call_llm_with_retry, so a hit is only served when the
+LLM would see exactly the same input and the same guards would apply.
+"""
+
+import copy
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any
+
+# Maximum number of cached responses (least recently used are evicted first)
+MAX_CACHED_RESPONSES = 256
+
+
+def is_cacheable_llm(llm: Any) -> bool:
+    """Return True if the LLM is configured for deterministic output.
+
+    Only temperature 0 models are cached — sampling at any other
+    temperature is expected to produce different responses.
+    """
+    return getattr(llm, "temperature", None) == 0
+
+
+def build_cache_key(llm: Any, messages: list, context: dict[str, Any]) -> str:
+    """Build a stable cache key for an LLM call.
+
+    Args:
+        llm: The LLM instance (its model name is part of the key).
+        messages: The LangChain message list about to be sent.
+        context: Extra inputs that influence how the response is validated.
+
+    Returns:
+        A hex SHA-256 digest identifying the call.
+    """
+    payload = {
+        "model": getattr(llm, "model_name", None) or getattr(llm, "model", None),
+        "messages": [
+            [msg.__class__.__name__, getattr(msg, "content", "")]
+            for msg in messages
+        ],
+        "context": context,
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Bounded LRU cache of parsed LLM response dicts.
+
+    Values are deep-copied on the way in and out because downstream
+    nodes mutate the parsed response (e.g. finalize fills in FORM_COMPLETE
+    data).
+    """
+
+    def __init__(self, max_size: int = MAX_CACHED_RESPONSES):
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._max_size = max_size
+
+    def get(self, key: str) -> dict | None:
+        """Return a copy of the cached response, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(entry)
+
+    def put(self, key: str, response: dict) -> None:
+        """Store a parsed response, evicting the least recently used entry."""
+        self._entries[key] = copy.deepcopy(response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide cache shared by all sessions
+response_cache = LLMResponseCache()
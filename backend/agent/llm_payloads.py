@@ -2,9 +2,20 @@
 Pydantic models for validating/normalizing LLM JSON payloads.
 """
 
-from typing import Any, Literal
+import sys
+from typing import Annotated, Any, Literal, Union
 
-from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    model_validator,
+)
+
+# Identifiers the frontend acts on; an empty string is as bad as a missing key
+_NonEmptyStr = Annotated[str, Field(min_length=1)]
 
 
 class _BasePayload(BaseModel):
@@ -33,35 +44,35 @@ class MessagePayload(_BasePayload):
 
 class AskTextPayload(_BasePayload):
     action: Literal["ASK_TEXT"]
-    field_id: str
+    field_id: _NonEmptyStr
     label: str | None = None
     message: str | None = None
 
 
 class AskDatePayload(_BasePayload):
     action: Literal["ASK_DATE"]
-    field_id: str
+    field_id: _NonEmptyStr
     label: str | None = None
     message: str | None = None
 
 
 class AskDatetimePayload(_BasePayload):
     action: Literal["ASK_DATETIME"]
-    field_id: str
+    field_id: _NonEmptyStr
     label: str | None = None
     message: str | None = None
 
 
 class AskLocationPayload(_BasePayload):
     action: Literal["ASK_LOCATION"]
-    field_id: str
+    field_id: _NonEmptyStr
     label: str | None = None
     message: str | None = None
 
 
 class AskDropdownPayload(_BasePayload):
     action: Literal["ASK_DROPDOWN"]
-    field_id: str
+    field_id: _NonEmptyStr
     options: list[Any] = Field(default_factory=list)
     label: str | None = None
     message: str | None = None
@@ -69,7 +80,7 @@ class AskDropdownPayload(_BasePayload):
 
 class AskCheckboxPayload(_BasePayload):
     action: Literal["ASK_CHECKBOX"]
-    field_id: str
+    field_id: _NonEmptyStr
     options: list[Any] = Field(default_factory=list)
     label: str | None = None
     message: str | None = None
@@ -77,7 +88,7 @@ class AskCheckboxPayload(_BasePayload):
 
 class ToolCallPayload(_BasePayload):
     action: Literal["TOOL_CALL"]
-    tool_name: str
+    tool_name: _NonEmptyStr
     tool_args: dict[str, Any] = Field(default_factory=dict)
     message: str | None = None
 
@@ -88,38 +99,46 @@ class FormCompletePayload(_BasePayload):
     message: str | None = None
 
 
+# Tagged union of all action payloads. pydantic-core dispatches on the
+# "action" value straight to the matching model instead of trying each
+# member in turn.
+ActionPayload = Annotated[
+    Union[
+        MessagePayload,
+        AskTextPayload,
+        AskDatePayload,
+        AskDatetimePayload,
+        AskLocationPayload,
+        AskDropdownPayload,
+        AskCheckboxPayload,
+        ToolCallPayload,
+        FormCompletePayload,
+    ],
+    Field(discriminator="action"),
+]
+
+_ACTION_ADAPTER: TypeAdapter[ActionPayload] = TypeAdapter(
+    ActionPayload, config=ConfigDict(title="ActionPayload"),
+)
+
+
 def validate_llm_payload(payload: dict[str, Any]) -> tuple[dict[str, Any] | None, str | None]:
     """Validate and normalize an LLM payload with pydantic models."""
-    intent = payload.get("intent")
-    action = payload.get("action")
-    model: type[BaseModel] | None = None
-
-    if intent == "multi_answer":
-        model = MultiAnswerPayload
-    elif action == "MESSAGE":
-        model = MessagePayload
-    elif action == "ASK_TEXT":
-        model = AskTextPayload
-    elif action == "ASK_DATE":
-        model = AskDatePayload
-    elif action == "ASK_DATETIME":
-        model = AskDatetimePayload
-    elif action == "ASK_LOCATION":
-        model = AskLocationPayload
-    elif action == "ASK_DROPDOWN":
-        model = AskDropdownPayload
-    elif action == "ASK_CHECKBOX":
-        model = AskCheckboxPayload
-    elif action == "TOOL_CALL":
-        model = ToolCallPayload
-    elif action == "FORM_COMPLETE":
-        model = FormCompletePayload
-    else:
-        return None, "Payload must contain a valid 'action' or intent='multi_answer'."
-
     try:
-        validated = model.model_validate(payload)
+        if payload.get("intent") == "multi_answer":
+            validated = MultiAnswerPayload.model_validate(payload)
+        elif isinstance(payload.get("action"), str):
+            validated = _ACTION_ADAPTER.validate_python(payload)
+        else:
+            return None, "Payload must contain a valid 'action' or intent='multi_answer'."
     except ValidationError as e:
         return None, str(e)
 
-    return validated.model_dump(exclude_none=True), None
+    normalized = validated.model_dump(exclude_none=True)
+    # Strings decoded from JSON are fresh objects; interning the
+    # discriminators lets comparisons against action literals short-circuit
+    # on identity.
+    for key in ("action", "intent"):
+        if key in normalized:
+            normalized[key] = sys.intern(normalized[key])
+    return normalized, None
@@ -8,6 +8,7 @@ a partial state update dict. Nodes communicate through the shared state.
 from backend.agent.nodes.conversation import conversation_node
 from backend.agent.nodes.extraction import extraction_node
 from backend.agent.nodes.finalize import finalize_node
+from backend.agent.nodes.form_complete import form_complete_node
 from backend.agent.nodes.greeting import greeting_node
 from backend.agent.nodes.step_confirmation import step_confirmation_node
 from backend.agent.nodes.tool_handler import tool_handler_node
@@ -21,4 +22,5 @@ __all__ = [
     "extraction_node",
     "conversation_node",
     "finalize_node",
+    "form_complete_node",
 ]
@@ -17,6 +17,13 @@ from backend.core.actions import build_message_action
 
 logger = logging.getLogger(__name__)
 
+# LangChain message class for each conversation history role
+_MESSAGE_CLASSES = {
+    "user": HumanMessage,
+    "assistant": AIMessage,
+    "system": SystemMessage,
+}
+
 
 async def conversation_node(state: FormPilotState) -> dict:
     """Run a conversation turn: send context to LLM, get next action.
@@ -33,8 +40,8 @@ async def conversation_node(state: FormPilotState) -> dict:
     form_context_md = state["form_context_md"]
     user_message = state.get("user_message", "")
     llm = state["llm"]
-    answers = dict(state.get("answers", {}))
-    conversation_history = list(state.get("conversation_history", []))
+    answers = state.get("answers", {})
+    conversation_history = state.get("conversation_history", [])
     required_fields = state.get("required_fields", [])
     required_fields_by_step = state.get("required_fields_by_step", {})
     current_step = state.get("current_step", 1)
@@ -49,9 +56,11 @@ async def conversation_node(state: FormPilotState) -> dict:
     if not user_message_added and user_message.strip():
         history_entries.append({"role": "user", "content": user_message})
 
-    # Build the combined history (existing + newly added entries)
-    # for constructing the LLM message list
-    full_history = conversation_history + history_entries
+    # Only the tail of the history reaches the LLM, so slice it before
+    # combining instead of copying the whole (growing) history each turn
+    recent_history = (
+        conversation_history[-MAX_HISTORY_MESSAGES:] + history_entries
+    )[-MAX_HISTORY_MESSAGES:]
 
     active_required_fields = required_fields
     if required_fields_by_step and current_step in required_fields_by_step:
@@ -61,23 +70,17 @@ async def conversation_node(state: FormPilotState) -> dict:
     system_prompt = build_system_prompt(
         form_context_md=form_context_md,
         answers=answers,
-        conversation_history=full_history,
+        conversation_history=recent_history,
         required_fields=active_required_fields,
     )
 
     messages = [SystemMessage(content=system_prompt)]
 
     # Include recent conversation history as LangChain messages
-    recent_history = full_history[-MAX_HISTORY_MESSAGES:]
     for msg in recent_history:
-        role = msg["role"]
-        content = msg["content"]
-        if role == "user":
-            messages.append(HumanMessage(content=content))
-        elif role == "assistant":
-            messages.append(AIMessage(content=content))
-        elif role == "system":
-            messages.append(SystemMessage(content=content))
+        message_class = _MESSAGE_CLASSES.get(msg["role"])
+        if message_class is not None:
+            messages.append(message_class(content=msg["content"]))
 
     # Call LLM with retry and guard validation
     parsed = await call_llm_with_retry(
@@ -3,19 +3,92 @@ Extraction node — bulk extraction from the user's initial free-text.
 
 Calls the LLM with the extraction prompt to parse multiple field values
 from a single message. Validates extracted date/datetime answers before
-storing them.
+storing them. Bare greetings skip the LLM entirely.
+
+The extraction response may also carry the next field action
+(`next_action`). When it passes the same checks the conversation turn
+would apply, it is used directly and the follow-up LLM call is skipped.
 """
 
 import logging
+from typing import Any
 
 from langchain_core.messages import HumanMessage, SystemMessage
 
+from backend.agent.llm_payloads import validate_llm_payload
 from backend.agent.prompts import build_extraction_prompt
 from backend.agent.state import FormPilotState
 from backend.agent.utils import call_llm_with_retry, validate_answer_for_action
 
 logger = logging.getLogger(__name__)
 
+# Bare greetings and acknowledgements that cannot contain field values.
+# Matched against the whole message after normalization.
+_TRIVIAL_MESSAGES = frozenset({
+    "hi", "hii", "hello", "hey", "hey there", "hi there", "hello there",
+    "yo", "sup", "ok", "okay", "good morning", "good afternoon",
+    "good evening", "salam", "salaam", "marhaba",
+    "مرحبا", "اهلا", "أهلا", "السلام عليكم", "سلام",
+})
+
+
+def _is_trivial_message(message: str) -> bool:
+    """Return True if the message is a bare greeting with nothing to extract."""
+    words = "".join(
+        ch if ch.isalnum() else " " for ch in message.casefold()
+    ).split()
+    return " ".join(words) in _TRIVIAL_MESSAGES
+
+
+# Actions the extraction call may hand straight to finalize
+_FUSED_ACTION_TYPES = {
+    "ASK_TEXT",
+    "ASK_DATE",
+    "ASK_DATETIME",
+    "ASK_LOCATION",
+    "ASK_DROPDOWN",
+    "ASK_CHECKBOX",
+    "TOOL_CALL",
+}
+
+
+def _accept_next_action(
+    next_action: Any,
+    answers: dict[str, Any],
+    field_types: dict[str, str],
+    step_fields: list[str] | None,
+    required_fields: list[str],
+) -> dict | None:
+    """Return the fused next action if it is safe to use, else None.
+
+    Mirrors the conversation-turn guards: the payload must be schema-valid,
+    must not re-ask an answered field, must target a known field in the
+    current step, and dropdown/checkbox actions must carry options.
+    """
+    if not isinstance(next_action, dict):
+        return None
+    action = next_action.get("action")
+    if not isinstance(action, str) or action not in _FUSED_ACTION_TYPES:
+        return None
+
+    normalized, _ = validate_llm_payload(next_action)
+    if normalized is None:
+        return None
+
+    if action == "TOOL_CALL":
+        return normalized
+
+    field_id = normalized["field_id"]
+    if field_id in answers:
+        return None
+    if field_types and field_id not in field_types:
+        return None
+    if step_fields is not None and field_id in required_fields and field_id not in step_fields:
+        return None
+    if action in ("ASK_DROPDOWN", "ASK_CHECKBOX") and not normalized.get("options"):
+        return None
+    return normalized
+
 
 async def extraction_node(state: FormPilotState) -> dict:
     """Extract field values from the user's free-text description.
@@ -31,8 +104,9 @@ async def extraction_node(state: FormPilotState) -> dict:
     user_message = state.get("user_message", "")
     llm = state["llm"]
     field_types = state.get("field_types", {})
-    answers = dict(state.get("answers", {}))
+    answers = state.get("answers", {})
     required_fields = state.get("required_fields", [])
+    required_fields_by_step = state.get("required_fields_by_step", {})
     current_step = state.get("current_step", 1)
     max_step = state.get("max_step", 1)
 
@@ -48,6 +122,12 @@ async def extraction_node(state: FormPilotState) -> dict:
         "parsed_llm_response": None,
     }
 
+    # A bare greeting cannot contain field values — go straight to the
+    # conversation turn instead of spending an extraction call on it
+    if _is_trivial_message(user_message):
+        logger.info("Skipping extraction for trivial message")
+        return updates
+
     # Build extraction prompt and call LLM
     extraction_prompt = build_extraction_prompt(form_context_md)
     messages = [
@@ -98,6 +178,22 @@ async def extraction_node(state: FormPilotState) -> dict:
                 + [{"role": "assistant", "content": llm_message}]
             )
 
+        # Use the fused next action if it is safe; finalize handles it
+        next_action = _accept_next_action(
+            parsed.get("next_action"),
+            {**answers, **updates.get("answers", {})},
+            field_types,
+            required_fields_by_step.get(current_step),
+            required_fields,
+        )
+        if next_action is not None:
+            logger.info(
+                "Using fused next action from extraction: %s",
+                next_action["action"],
+            )
+            updates["parsed_llm_response"] = next_action
+            return updates
+
         # Route to conversation for the next field action
         return updates
 
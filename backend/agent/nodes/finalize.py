@@ -8,6 +8,8 @@ handles FORM_COMPLETE data, and records the assistant message.
 
 import logging
 import re
+from collections import ChainMap
+from collections.abc import Mapping
 
 from backend.agent.state import FormPilotState
 
@@ -34,7 +36,7 @@ def finalize_node(state: FormPilotState) -> dict:
 
     pending_text_value = state.get("pending_text_value")
     pending_text_field_id = state.get("pending_text_field_id")
-    current_answers = dict(state.get("answers", {}))
+    current_answers = state.get("answers", {})
     required_by_step = state.get("required_fields_by_step", {})
     current_step = state.get("current_step", 1)
     max_step = state.get("max_step", 1)
@@ -81,10 +83,13 @@ def finalize_node(state: FormPilotState) -> dict:
 
     # Track which field is being asked — the user's next message
     # will be auto-stored as the answer for this field
+    updates["pending_options"] = None
     if action_type.startswith("ASK_") and field_id:
         updates["pending_field_id"] = field_id
         updates["pending_action_type"] = action_type
         updates["pending_tool_name"] = None
+        if action_type == "ASK_DROPDOWN":
+            updates["pending_options"] = _build_options_lookup(parsed.get("options"))
         logger.info("Now asking field: %s (type: %s)", field_id, action_type)
     elif action_type == "TOOL_CALL":
         updates["pending_tool_name"] = parsed.get("tool_name")
@@ -102,10 +107,9 @@ def finalize_node(state: FormPilotState) -> dict:
         if isinstance(data, dict):
             answers_update.update(data)
         # Ensure the data field is populated with all answers
-        merged_answers = dict(current_answers)
-        merged_answers.update(answers_update)
         if "data" not in parsed or not parsed["data"]:
-            parsed["data"] = merged_answers
+            parsed["data"] = {**current_answers, **answers_update}
+        updates["completed_action"] = parsed
 
     # Record assistant message in history
     msg = parsed.get("message") or parsed.get("text", "")
@@ -122,8 +126,8 @@ def finalize_node(state: FormPilotState) -> dict:
     # --- Step checkpoint (human-in-the-loop) ---
     # In multi-step forms, after collecting all required fields for the
     # current step, pause and ask the user to confirm before moving on.
-    merged_answers = dict(current_answers)
-    merged_answers.update(answers_update)
+    # Read-only view of the answers after this turn; no copy needed
+    merged_answers = ChainMap(answers_update, current_answers)
     step_required = required_by_step.get(current_step, [])
     is_multi_step = bool(required_by_step) and max_step > 1
     step_complete = bool(step_required) and all(fid in merged_answers for fid in step_required)
@@ -145,16 +149,30 @@ def finalize_node(state: FormPilotState) -> dict:
         updates["pending_field_id"] = None
         updates["pending_action_type"] = None
         updates["pending_tool_name"] = None
+        updates["pending_options"] = None
         updates["awaiting_step_confirmation"] = True
         updates["conversation_history"] = [{"role": "assistant", "content": summary_text}]
 
     return updates
 
 
+def _build_options_lookup(options: object) -> dict[str, str] | None:
+    """Map casefolded dropdown options to their original text.
+
+    Returns None unless every option is a plain string (tool-provided
+    option objects are left to the LLM to interpret).
+    """
+    if not isinstance(options, list) or not options:
+        return None
+    if not all(isinstance(option, str) for option in options):
+        return None
+    return {option.casefold(): option for option in options}
+
+
 def _build_step_summary(
     step: int,
     field_ids: list[str],
-    answers: dict,
+    answers: Mapping,
     field_prompt_map: dict[str, str],
 ) -> str:
     lines = [f"Step {step} is complete. Here is a quick summary:"]
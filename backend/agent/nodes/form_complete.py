@@ -0,0 +1,18 @@
+"""
+Form complete node — replays the completed form result.
+
+Once the form is complete, turns that carry no new input (no user
+message, no tool results) have nothing for the LLM to act on. This node
+returns the stored FORM_COMPLETE action instead of calling the LLM.
+"""
+
+from backend.agent.state import FormPilotState
+
+
+def form_complete_node(state: FormPilotState) -> dict:
+    """Return the stored FORM_COMPLETE action unchanged.
+
+    Returns:
+        Partial state with the completed action.
+    """
+    return {"action": state["completed_action"]}
@@ -6,6 +6,8 @@ to the next step. The user can also request updates to items in that step.
 """
 
 import re
+from collections.abc import Callable
+from functools import lru_cache
 
 from backend.agent.state import FormPilotState
 from backend.core.actions import build_message_action
@@ -119,19 +121,43 @@ def step_confirmation_node(state: FormPilotState) -> dict:
     return updates
 
 
-def _is_confirm(text: str) -> bool:
-    return any(_has_token(text, token) for token in _CONFIRM_WORDS)
+def _compile_token_matcher(tokens: set[str]) -> Callable[[str], bool]:
+    """Compile a token set into one predicate over lowercased text.
 
+    Short latin words need word boundaries (avoids "my" matching "y"), so
+    they are folded into a single precompiled regex; every other token is
+    a plain substring check.
+    """
+    bounded = sorted(
+        t for t in tokens if t.isascii() and t.isalpha() and len(t) <= 3
+    )
+    substrings = tuple(sorted(
+        (t for t in tokens if t not in bounded), key=len,
+    ))
+    pattern = (
+        re.compile(r"\b(?:" + "|".join(map(re.escape, bounded)) + r")\b")
+        if bounded else None
+    )
 
-def _is_edit_request(text: str) -> bool:
-    return any(_has_token(text, token) for token in _EDIT_WORDS)
+    # Cheap substring checks run first; the regex only runs if they all miss
+    def matches(text: str) -> bool:
+        if any(token in text for token in substrings):
+            return True
+        return pattern is not None and pattern.search(text) is not None
+
+    return matches
+
+
+_matches_confirm = _compile_token_matcher(_CONFIRM_WORDS)
+_matches_edit = _compile_token_matcher(_EDIT_WORDS)
 
 
-def _has_token(text: str, token: str) -> bool:
-    # For short latin words, use word boundaries (avoids "my" matching "y").
-    if token.isascii() and token.isalpha() and len(token) <= 3:
-        return re.search(rf"\b{re.escape(token)}\b", text) is not None
-    return token in text
+def _is_confirm(text: str) -> bool:
+    return _matches_confirm(text)
+
+
+def _is_edit_request(text: str) -> bool:
+    return _matches_edit(text)
 
 
 def _infer_requested_field(
@@ -148,17 +174,19 @@ def _infer_requested_field(
     return None
 
 
-def _important_words(label: str) -> list[str]:
+@lru_cache(maxsize=256)
+def _important_words(label: str) -> tuple[str, ...]:
+    # Labels come from the form definition, so results are reused across turns.
     words = re.findall(r"[a-zA-Z]{4,}", label)
-    return [w for w in words if w not in {"please", "provide", "share"}]
+    return tuple(w for w in words if w not in {"please", "provide", "share"})
+
+
+_FIELD_TYPE_ACTIONS = {
+    "date": "ASK_DATE",
+    "datetime": "ASK_DATETIME",
+    "location": "ASK_LOCATION",
+}
 
 
 def _action_for_field_type(field_type: str) -> str:
-    field_type = (field_type or "").lower()
-    if field_type == "date":
-        return "ASK_DATE"
-    if field_type == "datetime":
-        return "ASK_DATETIME"
-    if field_type == "location":
-        return "ASK_LOCATION"
-    return "ASK_TEXT"
+    return _FIELD_TYPE_ACTIONS.get((field_type or "").lower(), "ASK_TEXT")
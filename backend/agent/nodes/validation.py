@@ -3,7 +3,8 @@ Validate input node — validates user answers for pending fields.
 
 Two validation strategies:
 1. Format validation (ASK_DATE, ASK_DATETIME): deterministic check before
-   storing — reject immediately if format is wrong.
+   storing — reject immediately if format is wrong. Dropdown replies that
+   exactly match an offered option are normalized to that option's casing.
 2. Context validation (ASK_TEXT): hold the answer and let the LLM judge
    if it's relevant. The LLM either accepts (moves to next field) or
    rejects (re-asks same field).
@@ -77,18 +78,26 @@ def validate_input_node(state: FormPilotState) -> dict:
         is_valid, validation_error = validate_answer_for_action(
             pending_action_type or "", raw_answer
         )
+        answer_value = raw_answer
+        pending_options = state.get("pending_options")
+        if pending_action_type == "ASK_DROPDOWN" and pending_options:
+            # Fast path: an exact (case-insensitive) option match is stored
+            # with the option's own casing; anything else is kept verbatim
+            # for the LLM to interpret, as before.
+            answer_value = pending_options.get(raw_answer.casefold(), raw_answer)
         if is_valid:
-            answers_update[pending_field_id] = raw_answer
+            answers_update[pending_field_id] = answer_value
             logger.info(
                 "Auto-stored answer: %s = %s",
                 pending_field_id,
-                raw_answer[:100],
+                answer_value[:100],
             )
             # Add user message to history (matches original fall-through behavior)
             history_entries.append({"role": "user", "content": user_message})
             updates.update({
                 "pending_field_id": None,
                 "pending_action_type": None,
+                "pending_options": None,
             })
         else:
             # Validation failed — keep pending field, inject error directive
@@ -15,6 +15,7 @@ large and causes the model to ignore output format instructions.
 
 import json
 import re
+from functools import lru_cache
 from typing import Any
 
 from backend.agent.frontmatter import (
@@ -332,6 +333,7 @@ def _extract_types_from_table(form_context_md: str) -> dict[str, str]:
     return field_types
 
 
+@lru_cache(maxsize=32)
 def condense_form_context(form_context_md: str) -> str:
     """Condense a large form markdown to just the essential sections.
 
@@ -537,6 +539,12 @@ Correct response: {{"intent": "multi_answer", "answers": {{"injuryDate": "2026-0
 User says: "I want to report an injury"
 Correct response: {{"intent": "multi_answer", "answers": {{}}, "message": "I understand you want to report an injury. Let me guide you through the form."}}
 
+OPTIONAL: add "next_action" with the action for the FIRST required field that is
+still unanswered, in the same format you would use to ask it (ASK_TEXT, ASK_DATE,
+ASK_DROPDOWN with its static options, or TOOL_CALL if it needs data first).
+Example: {{"intent": "multi_answer", "answers": {{}}, "message": "...", "next_action": {{"action": "ASK_TEXT", "field_id": "fieldId", "label": "Label", "message": "Question?"}}}}
+Omit "next_action" if you are not sure.
+
 === FORM FIELDS REFERENCE ===
 {form_context_md}
 === END FORM FIELDS REFERENCE ===
@@ -6,12 +6,18 @@ A single, inspectable TypedDict that tracks all conversation state.
 
 Uses LangGraph reducers for fields that accumulate across nodes:
 - answers: merge semantics (new answers merged into existing)
-- conversation_history: append semantics (new entries appended)
+- conversation_history: append semantics, keeping only the most recent
+  entries (collected answers live in `answers` and are restated in every
+  prompt, so old turns carry no information the LLM still needs)
 """
 
-from operator import add
 from typing import Annotated, Any, TypedDict
 
+# Maximum conversation history entries kept in state. Only the last
+# MAX_HISTORY_MESSAGES (see agent.utils) are sent to the LLM; the extra
+# headroom keeps recent context available to nodes that scan history.
+MAX_STORED_HISTORY_MESSAGES = 100
+
 
 def merge_answers(current: dict, update: dict) -> dict:
     """Reducer that merges answer updates into the existing answers dict."""
@@ -21,6 +27,14 @@ def merge_answers(current: dict, update: dict) -> dict:
     return merged
 
 
+def append_history(current: list, update: list) -> list:
+    """Reducer that appends history entries and drops the oldest overflow."""
+    combined = (current or []) + (update or [])
+    if len(combined) > MAX_STORED_HISTORY_MESSAGES:
+        return combined[-MAX_STORED_HISTORY_MESSAGES:]
+    return combined
+
+
 class FormPilotState(TypedDict, total=False):
     """Complete state for a form-filling conversation turn.
 
@@ -40,7 +54,7 @@ class FormPilotState(TypedDict, total=False):
 
     # --- Accumulated state (persists across turns, with reducers) ---
     answers: Annotated[dict[str, Any], merge_answers]
-    conversation_history: Annotated[list[dict[str, str]], add]
+    conversation_history: Annotated[list[dict[str, str]], append_history]
     required_fields: list[str]
     required_fields_by_step: dict[int, list[str]]
     field_prompt_map: dict[str, str]
@@ -55,12 +69,18 @@ class FormPilotState(TypedDict, total=False):
     allow_answered_field_update: bool
     pending_field_id: str | None
     pending_action_type: str | None
+    # Casefolded option -> option for a pending ASK_DROPDOWN with static
+    # string options, used to store an exact case-insensitive match with
+    # the option's own casing (other replies are stored verbatim)
+    pending_options: dict[str, str] | None
     pending_text_value: str | None
     pending_text_field_id: str | None
     pending_tool_name: str | None
 
     # --- Output (set by finalize node, returned to caller) ---
     action: dict[str, Any]
+    # Last FORM_COMPLETE action; replayed for turns without new input
+    completed_action: dict[str, Any] | None
 
     # --- Intermediate (ephemeral, reset each turn) ---
     # Raw parsed LLM response before finalization
@@ -5,15 +5,19 @@ Contains constants, validation functions, JSON extraction, and the
 LLM call-with-retry helper used by both extraction and conversation nodes.
 """
 
+import asyncio
 import json
 import logging
+import random
 import re
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Any
 
 from dateutil import parser as dateutil_parser
 from langchain_core.messages import HumanMessage
 
+from backend.agent.llm_cache import build_cache_key, is_cacheable_llm, response_cache
 from backend.agent.llm_payloads import validate_llm_payload
 
 logger = logging.getLogger(__name__)
@@ -47,9 +51,23 @@ JSON_RETRY_PROMPT = (
     "NO explanations. NO markdown. NO plain text. ONLY JSON. Try again now."
 )
 
+# Backoff (seconds) between LLM calls that raised, e.g. rate limits or
+# timeouts. Doubles per attempt up to the max, plus up to 20% jitter.
+LLM_RETRY_BASE_DELAY = 0.5
+LLM_RETRY_MAX_DELAY = 8.0
+
 # Maximum conversation history messages to include in LLM context
 MAX_HISTORY_MESSAGES = 30
 
+# Body of a markdown code fence, with an optional "json" language tag
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Return the jittered backoff delay before retrying a failed LLM call."""
+    delay = min(LLM_RETRY_BASE_DELAY * 2 ** attempt, LLM_RETRY_MAX_DELAY)
+    return delay + random.uniform(0, delay * 0.2)
+
 
 def _normalize_text(value: str) -> str:
     """Normalize text for lenient equality checks."""
@@ -111,15 +129,20 @@ def extract_json(content: str) -> dict | None:
     except json.JSONDecodeError:
         pass
 
-    # Try extracting from markdown code fence
+    # Fast path: the whole response is a single fenced block
+    stripped = content.strip()
+    if stripped.startswith("```") and stripped.endswith("```") and len(stripped) > 6:
+        _, _, fenced = stripped[3:-3].partition("\n")
+        try:
+            return json.loads(fenced)
+        except json.JSONDecodeError:
+            pass
+
+    # Try extracting from markdown code fences anywhere in the content
     if "```" in content:
-        parts = content.split("```")
-        for part in parts:
-            stripped = part.strip()
-            if stripped.startswith("json"):
-                stripped = stripped[4:].strip()
+        for match in _JSON_FENCE_RE.finditer(content):
             try:
-                return json.loads(stripped)
+                return json.loads(match.group(1))
             except json.JSONDecodeError:
                 continue
 
@@ -190,6 +213,33 @@ def extract_options_hint(tool_data: dict) -> str:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1024)
+def _parse_datetime(value: str) -> datetime | None:
+    """Parse a date/time string with dateutil, or return None if it can't.
+
+    Memoized: the same answers are re-validated across turns and
+    extraction, and datetimes are immutable. The bounded size keeps
+    arbitrary user input from growing the cache.
+    """
+    if _looks_like_iso_date(value):
+        # Canonical YYYY-MM-DD[...] answers (what date pickers send) parse
+        # much faster with the stdlib; anything it rejects still gets the
+        # lenient dateutil parse below.
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    try:
+        return dateutil_parser.parse(value, dayfirst=False)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def _looks_like_iso_date(value: str) -> bool:
+    """Cheap shape check for a string starting with YYYY-MM-DD."""
+    return len(value) >= 10 and value[4] == "-" and value[7] == "-"
+
+
 def validate_date_answer(value: str) -> tuple[bool, str]:
     """Validate that a string is a recognizable date.
 
@@ -214,18 +264,15 @@ def validate_date_answer(value: str) -> tuple[bool, str]:
             "Please provide a date like 2026-01-15 or January 15, 2026."
         )
 
-    try:
-        parsed = dateutil_parser.parse(stripped, dayfirst=False)
-        # Extra sanity: reject dates with impossible month/day that
-        # dateutil might silently swap or misparse
-        if not isinstance(parsed.date(), date):
-            raise ValueError
-        return True, ""
-    except (ValueError, TypeError, OverflowError):
+    parsed = _parse_datetime(stripped)
+    # Extra sanity: reject dates with impossible month/day that
+    # dateutil might silently swap or misparse
+    if parsed is None or not isinstance(parsed.date(), date):
         return False, (
             f"'{stripped}' is not a valid date. "
             "Please provide a date like 2026-01-15 or January 15, 2026."
         )
+    return True, ""
 
 
 def validate_datetime_answer(value: str) -> tuple[bool, str]:
@@ -247,16 +294,13 @@ def validate_datetime_answer(value: str) -> tuple[bool, str]:
             "Please provide something like 2026-01-15 10:30 AM."
         )
 
-    try:
-        parsed = dateutil_parser.parse(stripped, dayfirst=False)
-        if not isinstance(parsed, datetime):
-            raise ValueError
-        return True, ""
-    except (ValueError, TypeError, OverflowError):
+    parsed = _parse_datetime(stripped)
+    if not isinstance(parsed, datetime):
         return False, (
             f"'{stripped}' is not a valid date/time. "
             "Please provide something like 2026-01-15 10:30 AM."
         )
+    return True, ""
 
 
 def validate_answer_for_action(
@@ -274,11 +318,17 @@ def validate_answer_for_action(
     Returns:
         A tuple of (is_valid, error_message).
     """
-    if action_type == "ASK_DATE":
-        return validate_date_answer(value)
-    elif action_type == "ASK_DATETIME":
-        return validate_datetime_answer(value)
-    return True, ""
+    validator = _ANSWER_VALIDATORS.get(action_type)
+    if validator is None:
+        return True, ""
+    return validator(value)
+
+
+# Answer validator for each ASK_* type with a checkable format
+_ANSWER_VALIDATORS = {
+    "ASK_DATE": validate_date_answer,
+    "ASK_DATETIME": validate_datetime_answer,
+}
 
 
 # ---------------------------------------------------------------------------
@@ -298,6 +348,10 @@ async def call_llm_with_retry(
 ) -> dict | None:
     """Call the LLM and parse its JSON response, with retries and guards.
 
+    Invalid output is retried immediately with a corrective prompt; calls
+    that raise (rate limits, timeouts) are retried after an exponential
+    backoff with jitter.
+
     Guards catch common LLM mistakes:
     - Invalid JSON output
     - Unknown action types
@@ -306,6 +360,10 @@ async def call_llm_with_retry(
     - ASK_DROPDOWN/CHECKBOX with empty options
     - Premature FORM_COMPLETE with missing required fields
 
+    Responses from deterministic (temperature 0) models are cached by
+    their exact input, so an identical call is answered without going
+    to the LLM.
+
     Args:
         llm: A LangChain BaseChatModel instance.
         messages: The message list to send (mutated with retry prompts).
@@ -316,6 +374,24 @@ async def call_llm_with_retry(
     Returns:
         Parsed JSON dict, or None if all retries fail.
     """
+    cache_key = None
+    if is_cacheable_llm(llm):
+        cache_key = build_cache_key(llm, messages, {
+            "answers": answers,
+            "initial_extraction_done": initial_extraction_done,
+            "required_fields": required_fields,
+            "current_step": current_step,
+            "max_step": max_step,
+            "allow_answered_field_update": allow_answered_field_update,
+        })
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            logger.info(
+                "LLM response cache hit: %s",
+                cached.get("action") or cached.get("intent") or "unknown",
+            )
+            return cached
+
     for attempt in range(MAX_JSON_RETRIES + 1):
         try:
             logger.info(
@@ -355,6 +431,8 @@ async def call_llm_with_retry(
                     if text:
                         parsed = {"action": "MESSAGE", "text": text}
                         logger.info("Converted unknown action to MESSAGE")
+                        if cache_key is not None:
+                            response_cache.put(cache_key, parsed)
                         return parsed
                     # Otherwise retry — it's gibberish
                     messages.append(HumanMessage(content=JSON_RETRY_PROMPT))
@@ -405,11 +483,10 @@ async def call_llm_with_retry(
                 # that feel robotic. Force the LLM to rephrase.
                 if action.startswith("ASK_") and _has_recent_validation_directive(messages):
                     ask_message = str(parsed.get("message", "")).strip()
-                    previous_assistant = _last_assistant_message(messages)
-                    if (
-                        ask_message
-                        and previous_assistant
-                        and _normalize_text(ask_message) == _normalize_text(previous_assistant)
+                    # Only scan history for the previous question when there
+                    # is a message to compare it with.
+                    if ask_message and _normalize_text(ask_message) == _normalize_text(
+                        _last_assistant_message(messages)
                     ):
                         logger.warning(
                             "LLM repeated ASK message verbatim during validation for field '%s' — retrying with rephrase instruction",
@@ -514,6 +591,8 @@ async def call_llm_with_retry(
                     "LLM returned valid JSON action: %s",
                     action or intent or "unknown",
                 )
+                if cache_key is not None:
+                    response_cache.put(cache_key, parsed)
                 return parsed
 
             logger.warning(
@@ -528,6 +607,7 @@ async def call_llm_with_retry(
             logger.error("LLM call failed (attempt %d): %s", attempt + 1, e)
             if attempt == MAX_JSON_RETRIES:
                 return None
+            await asyncio.sleep(_retry_delay(attempt))
 
     logger.error(
         "All %d LLM attempts failed to produce valid JSON",
@@ -14,6 +14,8 @@ import uuid
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from backend.agent.graph import create_initial_state
 from backend.agent.state import FormPilotState
 
@@ -28,6 +30,9 @@ class Session:
     Holds the LangGraph state dict that persists across conversation turns.
     """
 
+    # The in-memory store keeps one of these per conversation
+    __slots__ = ("state", "created_at", "last_accessed_at")
+
     def __init__(self, state: FormPilotState):
         self.state: FormPilotState = state
         self.created_at: float = time.time()
@@ -144,15 +149,26 @@ class SessionStore:
 
 
 def _serialize_state(state: FormPilotState) -> str:
-    """Serialize a session state to JSON (excluding non-serializable LLM)."""
+    """Serialize a session state to JSON (excluding non-serializable LLM).
+
+    NaN and infinite floats are written as null by orjson.
+    """
     serializable = dict(state)
     # LLM object is runtime dependency and cannot be JSON-serialized.
     serializable.pop("llm", None)
-    return json.dumps(serializable, ensure_ascii=False)
+    try:
+        # Int-keyed dicts (required_fields_by_step) are written with string
+        # keys, as the stdlib encoder did.
+        return orjson.dumps(serializable, option=orjson.OPT_NON_STR_KEYS).decode()
+    except orjson.JSONEncodeError:
+        # e.g. integers wider than 64 bits
+        return json.dumps(serializable, ensure_ascii=False)
 
 
 def _deserialize_state(state_json: str, llm: Any) -> FormPilotState:
     """Deserialize JSON state and inject runtime LLM dependency."""
+    # stdlib, not orjson: orjson reads integers wider than 64 bits as floats
+    # and rejects the NaN/Infinity tokens older rows may contain.
     raw = json.loads(state_json)
     raw["llm"] = llm
     return FormPilotState(**raw)
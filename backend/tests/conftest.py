@@ -9,12 +9,38 @@ depending on any legacy orchestrator code.
 import asyncio
 from typing import Any
 
+import pytest
+from pytest_asyncio import is_async_test
+
 from backend.agent.graph import compile_graph, create_initial_state, prepare_turn_input
+from backend.agent.llm_cache import response_cache
 
 # Compile once — shared across all tests in the session
 _compiled_graph = compile_graph()
 
 
+def pytest_collection_modifyitems(items):
+    """Run every async test on one shared, session-scoped event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(autouse=True)
+def _no_llm_retry_backoff(monkeypatch):
+    """Retry failed LLM calls immediately so error-path tests stay fast."""
+    monkeypatch.setattr("backend.agent.utils.LLM_RETRY_BASE_DELAY", 0)
+
+
+@pytest.fixture(autouse=True)
+def _clear_llm_response_cache():
+    """Keep cached LLM responses from leaking between tests."""
+    response_cache.clear()
+    yield
+    response_cache.clear()
+
+
 class GraphRunner:
     """Test helper that wraps the LangGraph with a simple interface.
 
@@ -73,4 +99,10 @@ def _run_sync(coro):
         with concurrent.futures.ThreadPoolExecutor() as pool:
             return pool.submit(asyncio.run, coro).result()
     else:
-        return asyncio.run(coro)
+        # Not asyncio.run(): it clears the thread's current event loop on
+        # exit, which breaks the session-scoped loop later async tests use.
+        private_loop = asyncio.new_event_loop()
+        try:
+            return private_loop.run_until_complete(coro)
+        finally:
+            private_loop.close()
@@ -235,6 +235,15 @@ class TestChat:
 # --- /api/schemas tests ---
 
 
+@pytest.fixture(scope="session")
+def example_schemas() -> dict[str, str]:
+    """Example schema files, read from disk once per test session."""
+    return {
+        path.name: path.read_text(encoding="utf-8")
+        for path in sorted(SCHEMAS_DIR.glob("*.md"))
+    }
+
+
 class TestSchemas:
     """Tests for the GET /api/schemas endpoint."""
 
@@ -261,6 +270,13 @@ class TestSchemas:
             assert "content" in data
             assert "filename" in data
 
+    def test_schema_content_matches_file(self, example_schemas):
+        """Served content matches the file on disk."""
+        client, _, _ = _create_test_app()
+        for filename, content in example_schemas.items():
+            response = client.get(f"/api/schemas/{filename}")
+            assert response.json()["content"] == content
+
     def test_get_nonexistent_schema(self):
         client, _, _ = _create_test_app()
         response = client.get("/api/schemas/nonexistent.md")
@@ -354,3 +370,49 @@ class TestSessionStore:
         ids = store.list_session_ids()
         assert cid1 in ids
         assert cid2 in ids
+
+
+class TestSQLiteSessionStore:
+    """Tests for state round-trips through the SQLite store."""
+
+    def _store(self, tmp_path):
+        from backend.core.session import SQLiteSessionStore
+
+        return SQLiteSessionStore(str(tmp_path / "sessions.db"))
+
+    def test_wide_integer_round_trips(self, tmp_path):
+        store = self._store(tmp_path)
+        cid, session = store.create_session(SAMPLE_MD, MockLLM())
+
+        session.state["answers"] = {"amount": 2**70}
+        assert store.save_session(cid, session.state)
+        loaded = store.get_session(cid, llm=MockLLM())
+        assert loaded.state["answers"]["amount"] == 2**70
+
+    def test_nan_is_stored_as_null(self, tmp_path):
+        store = self._store(tmp_path)
+        cid, session = store.create_session(SAMPLE_MD, MockLLM())
+
+        session.state["answers"] = {"ratio": float("nan")}
+        store.save_session(cid, session.state)
+        loaded = store.get_session(cid, llm=MockLLM())
+        assert loaded.state["answers"]["ratio"] is None
+
+    def test_reads_rows_with_nan_tokens(self, tmp_path):
+        import math
+        import sqlite3
+
+        store = self._store(tmp_path)
+        cid, session = store.create_session(SAMPLE_MD, MockLLM())
+
+        # Rows written by the stdlib encoder may contain bare NaN tokens
+        state = dict(session.state)
+        state.pop("llm")
+        state["answers"] = {"ratio": float("nan")}
+        with sqlite3.connect(tmp_path / "sessions.db") as conn:
+            conn.execute(
+                "UPDATE sessions SET state_json = ? WHERE conversation_id = ?",
+                (json.dumps(state), cid),
+            )
+        loaded = store.get_session(cid, llm=MockLLM())
+        assert math.isnan(loaded.state["answers"]["ratio"])
@@ -6,13 +6,12 @@ Tests cover:
 - User provides partial data → extraction captures some, conversation continues
 - User provides gibberish → extraction finds nothing
 - Extraction with non-dict answers → handled gracefully
+- Fused next_action in the extraction response → follow-up call skipped
 """
 
 import json
 from unittest.mock import MagicMock
 
-import pytest
-
 from backend.tests.conftest import GraphRunner
 
 
@@ -54,7 +53,6 @@ class SequenceLLM:
 class TestCompleteExtractionOneShot:
     """User provides all required data in one free-text message."""
 
-    @pytest.mark.asyncio
     async def test_all_fields_extracted(self):
         """All leave fields extracted → stored in answers."""
         llm = SequenceLLM([
@@ -90,7 +88,6 @@ class TestCompleteExtractionOneShot:
 class TestPartialExtraction:
     """User provides some data, AI asks for the rest one at a time."""
 
-    @pytest.mark.asyncio
     async def test_partial_extraction(self):
         """User provides leave type only → extraction captures it → asks remaining."""
         llm = SequenceLLM([
@@ -118,7 +115,6 @@ class TestPartialExtraction:
 class TestGibberishExtraction:
     """User provides unintelligible text → extraction fails to find anything."""
 
-    @pytest.mark.asyncio
     async def test_gibberish_asks_first_field(self):
         """Empty extraction → falls back to asking fields one at a time."""
         llm = SequenceLLM([
@@ -139,13 +135,60 @@ class TestGibberishExtraction:
         assert result["field_id"] == "leave_type"
 
 
+# --- Fused next action ---
+
+
+class TestFusedNextAction:
+    """Extraction response carries the next field action."""
+
+    async def test_valid_next_action_skips_conversation_call(self):
+        """A safe next_action is returned without a second LLM call."""
+        llm = SequenceLLM([
+            {"intent": "multi_answer",
+             "answers": {"leave_type": "Sick"},
+             "message": "I noted your leave type as Sick.",
+             "next_action": {"action": "ASK_DATE", "field_id": "start_date",
+                             "label": "Start date?",
+                             "message": "When does your leave start?"}},
+        ])
+
+        orch = GraphRunner(LEAVE_FORM_MD, llm)
+        orch.get_initial_action()
+
+        result = await orch.process_user_message("I need sick leave")
+        assert llm.call_count == 1
+        assert result["action"] == "ASK_DATE"
+        assert result["field_id"] == "start_date"
+        assert orch.answers.get("leave_type") == "Sick"
+
+    async def test_next_action_for_answered_field_falls_through(self):
+        """A next_action re-asking an extracted field is ignored."""
+        llm = SequenceLLM([
+            {"intent": "multi_answer",
+             "answers": {"leave_type": "Sick"},
+             "message": "I noted your leave type as Sick.",
+             "next_action": {"action": "ASK_DROPDOWN", "field_id": "leave_type",
+                             "options": ["Annual", "Sick", "Emergency"]}},
+            # Conversation: ask start_date
+            {"action": "ASK_DATE", "field_id": "start_date",
+             "label": "Start date?",
+             "message": "When does your leave start?"},
+        ])
+
+        orch = GraphRunner(LEAVE_FORM_MD, llm)
+        orch.get_initial_action()
+
+        result = await orch.process_user_message("I need sick leave")
+        assert llm.call_count == 2
+        assert result["field_id"] == "start_date"
+
+
 # --- Extraction with non-dict answers ---
 
 
 class TestExtractionBadFormat:
     """Extraction returns answers in unexpected format."""
 
-    @pytest.mark.asyncio
     async def test_non_dict_answers_handled(self):
         """LLM returns answers as non-dict → falls through to conversation."""
         llm = SequenceLLM([
@@ -165,7 +208,6 @@ class TestExtractionBadFormat:
         assert result["action"] == "ASK_DROPDOWN"
         assert result["field_id"] == "leave_type"
 
-    @pytest.mark.asyncio
     async def test_extraction_sets_done_flag(self):
         """After extraction (even empty), flag is set and second message goes to conversation."""
         llm = SequenceLLM([
@@ -17,8 +17,6 @@ Tests cover:
 import json
 from unittest.mock import MagicMock
 
-import pytest
-
 from backend.tests.conftest import GraphRunner
 
 # Markdown form definitions for tests
@@ -77,7 +75,6 @@ class SequenceLLM:
 class TestFullLeaveRequestFlow:
     """Complete leave request conversation from start to FORM_COMPLETE."""
 
-    @pytest.mark.asyncio
     async def test_partial_extraction_then_followup(self):
         """User provides some info in description → extraction + follow-up."""
         llm = SequenceLLM([
@@ -123,7 +120,6 @@ class TestFullLeaveRequestFlow:
         assert a3["data"]["leave_type"] == "Annual"
         assert a3["data"]["reason"] == "Holiday"
 
-    @pytest.mark.asyncio
     async def test_all_fields_in_extraction(self):
         """User provides everything in one message → FORM_COMPLETE."""
         llm = SequenceLLM([
@@ -156,7 +152,6 @@ class TestFullLeaveRequestFlow:
 class TestToolCallFlow:
     """Full conversation with tool calls."""
 
-    @pytest.mark.asyncio
     async def test_tool_call_then_ask_field(self):
         """AI requests tool → frontend returns data → AI presents options."""
         llm = SequenceLLM([
@@ -215,7 +210,6 @@ class TestToolCallFlow:
 
         assert llm.call_count == 5
 
-    @pytest.mark.asyncio
     async def test_multiple_tool_calls_in_sequence(self):
         """Multiple tool calls executed one after another."""
         llm = SequenceLLM([
@@ -264,7 +258,6 @@ class TestToolCallFlow:
 class TestClarificationFlow:
     """User sends gibberish or unclear messages."""
 
-    @pytest.mark.asyncio
     async def test_gibberish_triggers_ask_field(self):
         """Empty extraction → LLM asks for first field."""
         llm = SequenceLLM([
@@ -290,7 +283,6 @@ class TestClarificationFlow:
 class TestConversationHistory:
     """Verify conversation history is maintained across turns."""
 
-    @pytest.mark.asyncio
     async def test_history_grows_with_each_turn(self):
         llm = SequenceLLM([
             {"intent": "multi_answer",
@@ -0,0 +1,185 @@
+"""
+Tests for the exact-match LLM response cache.
+
+Tests cover:
+- LLMResponseCache LRU behavior and copy semantics
+- Cacheability of deterministic vs sampling models
+- call_llm_with_retry serving identical calls from the cache
+- Extraction never reusing results across different messages
+"""
+
+import json
+from types import SimpleNamespace
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from backend.agent.llm_cache import (
+    LLMResponseCache,
+    build_cache_key,
+    is_cacheable_llm,
+    response_cache,
+)
+from backend.agent.utils import call_llm_with_retry
+from backend.tests.conftest import GraphRunner
+
+
+class CountingLLM:
+    """A mock LLM with a configurable temperature that counts calls."""
+
+    def __init__(self, response: dict, temperature: float = 0):
+        self.temperature = temperature
+        self.model_name = "test-model"
+        self._content = json.dumps(response)
+        self.call_count = 0
+
+    async def ainvoke(self, messages, **kwargs):
+        self.call_count += 1
+        return SimpleNamespace(content=self._content)
+
+
+MESSAGES = [SystemMessage(content="system"), HumanMessage(content="hello")]
+MESSAGE_RESPONSE = {"action": "MESSAGE", "text": "Hi there!"}
+EMPTY_EXTRACTION = {"intent": "multi_answer", "answers": {}, "message": "Hi!"}
+
+FORM_MD = """---
+title: Cache Form
+fields:
+  - id: leave_type
+    type: text
+    required: true
+---
+
+# Cache Form
+"""
+
+
+# =============================================================
+# Test: LLMResponseCache
+# =============================================================
+
+
+class TestLLMResponseCache:
+    """Tests for the bounded LRU response cache."""
+
+    def test_miss_returns_none(self):
+        cache = LLMResponseCache()
+        assert cache.get("missing") is None
+
+    def test_put_then_get(self):
+        cache = LLMResponseCache()
+        cache.put("k", MESSAGE_RESPONSE)
+        assert cache.get("k") == MESSAGE_RESPONSE
+
+    def test_returned_value_is_a_copy(self):
+        cache = LLMResponseCache()
+        cache.put("k", {"action": "FORM_COMPLETE", "data": {"a": 1}})
+        first = cache.get("k")
+        first["data"]["a"] = 2
+        assert cache.get("k")["data"] == {"a": 1}
+
+    def test_evicts_least_recently_used(self):
+        cache = LLMResponseCache(max_size=2)
+        cache.put("a", {"action": "MESSAGE", "text": "a"})
+        cache.put("b", {"action": "MESSAGE", "text": "b"})
+        cache.get("a")
+        cache.put("c", {"action": "MESSAGE", "text": "c"})
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+
+# =============================================================
+# Test: Cache keys and cacheability
+# =============================================================
+
+
+class TestCacheKey:
+    """Tests for cache key construction."""
+
+    def test_only_temperature_zero_is_cacheable(self):
+        assert is_cacheable_llm(CountingLLM(MESSAGE_RESPONSE, temperature=0))
+        assert not is_cacheable_llm(CountingLLM(MESSAGE_RESPONSE, temperature=0.7))
+        assert not is_cacheable_llm(object())
+
+    def test_key_depends_on_messages_and_context(self):
+        llm = CountingLLM(MESSAGE_RESPONSE)
+        key = build_cache_key(llm, MESSAGES, {"current_step": 1})
+        assert key == build_cache_key(llm, list(MESSAGES), {"current_step": 1})
+        assert key != build_cache_key(llm, MESSAGES, {"current_step": 2})
+        assert key != build_cache_key(
+            llm, [SystemMessage(content="system"), HumanMessage(content="bye")],
+            {"current_step": 1},
+        )
+
+
+# =============================================================
+# Test: call_llm_with_retry caching
+# =============================================================
+
+
+class TestCallLLMWithRetryCache:
+    """Tests for cache integration in call_llm_with_retry."""
+
+    async def test_identical_call_served_from_cache(self):
+        llm = CountingLLM(MESSAGE_RESPONSE)
+        first = await call_llm_with_retry(llm, list(MESSAGES), {}, True, [])
+        second = await call_llm_with_retry(llm, list(MESSAGES), {}, True, [])
+        assert first == second == MESSAGE_RESPONSE
+        assert llm.call_count == 1
+
+    async def test_different_answers_miss_cache(self):
+        # Before extraction, so MESSAGE is accepted with answers present
+        llm = CountingLLM(MESSAGE_RESPONSE)
+        await call_llm_with_retry(llm, list(MESSAGES), {}, False, [])
+        await call_llm_with_retry(llm, list(MESSAGES), {"name": "Alice"}, False, [])
+        assert llm.call_count == 2
+
+    async def test_sampling_model_is_not_cached(self):
+        llm = CountingLLM(MESSAGE_RESPONSE, temperature=0.7)
+        await call_llm_with_retry(llm, list(MESSAGES), {}, True, [])
+        await call_llm_with_retry(llm, list(MESSAGES), {}, True, [])
+        assert llm.call_count == 2
+        assert len(response_cache) == 0
+
+
+# =============================================================
+# Test: Extraction caching
+# =============================================================
+
+
+class SequenceLLM:
+    """A deterministic mock LLM that returns responses in order."""
+
+    def __init__(self, responses: list[dict]):
+        self.temperature = 0
+        self.model_name = "test-model"
+        self._responses = [json.dumps(r) for r in responses]
+        self.call_count = 0
+
+    async def ainvoke(self, messages, **kwargs):
+        content = self._responses[self.call_count]
+        self.call_count += 1
+        return SimpleNamespace(content=content)
+
+
+class TestExtractionCaching:
+    """Extraction results are only reused for identical LLM input."""
+
+    async def test_similar_message_is_extracted_again(self):
+        ask_leave = {"action": "ASK_TEXT", "field_id": "leave_type", "label": "Type?"}
+        first_llm = SequenceLLM([EMPTY_EXTRACTION, ask_leave])
+        first = GraphRunner(FORM_MD, first_llm)
+        await first.process_user_message(
+            "hello I would like to fill in the leave request form please"
+        )
+
+        # Nearly the same text, but it carries a value and must reach the LLM
+        sick = {"intent": "multi_answer", "answers": {"leave_type": "Sick"}}
+        done = {"action": "FORM_COMPLETE", "message": "Done!"}
+        second_llm = SequenceLLM([sick, done])
+        second = GraphRunner(FORM_MD, second_llm)
+        await second.process_user_message(
+            "hello I would like to fill in the sick leave request form please"
+        )
+        assert second_llm.call_count == 2
+        assert second.answers == {"leave_type": "Sick"}
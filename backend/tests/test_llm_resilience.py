@@ -8,13 +8,16 @@ Tests cover:
 - LLM returns JSON embedded in markdown code fences
 - LLM returns empty response
 - Retry mechanism: first attempt fails, second succeeds
+- Exponential backoff schedule and jitter bounds
 """
 
 import json
+import random
 from unittest.mock import MagicMock
 
 import pytest
 
+from backend.agent.utils import _retry_delay, extract_json
 from backend.tests.conftest import GraphRunner
 
 
@@ -102,7 +105,6 @@ class SequenceLLM:
 class TestMalformedJson:
     """LLM returns responses that are not valid JSON."""
 
-    @pytest.mark.asyncio
     async def test_completely_invalid_json_during_extraction(self):
         """LLM returns total garbage during extraction — should fall back gracefully."""
         llm = RawTextLLM([
@@ -118,13 +120,12 @@ class TestMalformedJson:
         orch = GraphRunner(LEAVE_FORM_MD, llm)
         orch.get_initial_action()
 
-        action = await orch.process_user_message("Hello")
+        action = await orch.process_user_message("I need help with this form")
         # Should return a fallback MESSAGE action, not crash
         assert "action" in action
         assert action["action"] == "MESSAGE"
         assert "trouble" in action["text"]
 
-    @pytest.mark.asyncio
     async def test_partial_json_during_extraction(self):
         """LLM returns truncated JSON during extraction."""
         llm = RawTextLLM([
@@ -143,16 +144,20 @@ class TestMalformedJson:
         action = await orch.process_user_message("Annual leave")
         assert "action" in action
 
-    @pytest.mark.asyncio
-    async def test_json_in_markdown_fence_extraction(self):
-        """LLM wraps extraction JSON in markdown code fences — should still parse."""
+    @pytest.mark.parametrize("template", [
+        "```json\n{payload}\n```",
+        "Sure! Here it is:\n```json\n{payload}\n```\nLet me know.",
+        "Here's my response: {payload} Hope that helps!",
+    ], ids=["fenced", "fenced-in-prose", "surrounding-text"])
+    async def test_wrapped_json_extraction(self, template):
+        """LLM wraps the extraction JSON in fences or prose — should still parse."""
         json_str = json.dumps({
             "intent": "multi_answer",
             "answers": {"leave_type": "Annual"},
             "message": "Got it!",
         })
         llm = RawTextLLM([
-            f"```json\n{json_str}\n```",
+            template.format(payload=json_str),
             # Conversation phase
             json.dumps({"action": "ASK_DATE", "field_id": "start_date",
                         "label": "Start?", "message": "When?"}),
@@ -161,31 +166,17 @@ class TestMalformedJson:
         orch = GraphRunner(LEAVE_FORM_MD, llm)
         orch.get_initial_action()
 
-        action = await orch.process_user_message("Annual leave")
+        await orch.process_user_message("Annual leave")
         assert orch.answers.get("leave_type") == "Annual"
 
-    @pytest.mark.asyncio
-    async def test_json_with_surrounding_text_extraction(self):
-        """LLM adds text before/after the extraction JSON."""
-        json_str = json.dumps({
-            "intent": "multi_answer",
-            "answers": {"leave_type": "Sick"},
-            "message": "Sick leave.",
-        })
-        llm = RawTextLLM([
-            f"Here's my response: {json_str} Hope that helps!",
-            # Conversation phase
-            json.dumps({"action": "ASK_DATE", "field_id": "start_date",
-                        "label": "Start?", "message": "When?"}),
-        ])
-
-        orch = GraphRunner(LEAVE_FORM_MD, llm)
-        orch.get_initial_action()
-
-        action = await orch.process_user_message("Sick")
-        assert orch.answers.get("leave_type") == "Sick"
+    def test_wide_integer_parsed_exactly(self):
+        """Integers wider than 64 bits (account numbers, IDs) keep every digit."""
+        parsed = extract_json(
+            '```json\n{"intent": "multi_answer", '
+            '"answers": {"account": 123456789012345678901234}}\n```'
+        )
+        assert parsed["answers"]["account"] == 123456789012345678901234
 
-    @pytest.mark.asyncio
     async def test_empty_response_during_extraction(self):
         """LLM returns empty string during extraction."""
         llm = RawTextLLM([
@@ -197,7 +188,7 @@ class TestMalformedJson:
         orch = GraphRunner(LEAVE_FORM_MD, llm)
         orch.get_initial_action()
 
-        action = await orch.process_user_message("Hello")
+        action = await orch.process_user_message("I need help with this form")
         assert "action" in action
 
 
@@ -207,7 +198,6 @@ class TestMalformedJson:
 class TestMalformedJsonConversation:
     """LLM returns bad JSON in the conversation follow-up phase."""
 
-    @pytest.mark.asyncio
     async def test_invalid_json_in_followup(self):
         """After extraction, LLM returns garbage in follow-up — fallback message."""
         llm = RawTextLLM([
@@ -241,7 +231,6 @@ class TestMalformedJsonConversation:
 class TestUnexpectedKeys:
     """LLM returns JSON with extra or missing keys."""
 
-    @pytest.mark.asyncio
     async def test_extra_keys_ignored_in_extraction(self):
         """Extra keys in extraction response should not cause errors."""
         llm = SequenceLLM([
@@ -263,7 +252,6 @@ class TestUnexpectedKeys:
         await orch.process_user_message("Annual leave")
         assert orch.answers.get("leave_type") == "Annual"
 
-    @pytest.mark.asyncio
     async def test_missing_message_key(self):
         """LLM response without 'message' key should still work."""
         llm = SequenceLLM([
@@ -285,7 +273,6 @@ class TestUnexpectedKeys:
 class TestLLMExceptions:
     """LLM raises exceptions (timeout, network error, etc)."""
 
-    @pytest.mark.asyncio
     async def test_llm_exception_during_extraction_returns_fallback(self):
         """When LLM throws during extraction, should return fallback message."""
         llm = ExceptionLLM("Connection timeout")
@@ -293,13 +280,12 @@ class TestLLMExceptions:
         orch = GraphRunner(LEAVE_FORM_MD, llm)
         orch.get_initial_action()
 
-        action = await orch.process_user_message("Hello")
+        action = await orch.process_user_message("I need help with this form")
         assert "action" in action
         # Should return a MESSAGE fallback
         assert action["action"] == "MESSAGE"
         assert "trouble" in action["text"]
 
-    @pytest.mark.asyncio
     async def test_llm_exception_does_not_corrupt_state(self):
         """LLM failure should not leave answers in an inconsistent state."""
         llm = ExceptionLLM("Boom")
@@ -307,7 +293,7 @@ class TestLLMExceptions:
         orch = GraphRunner(LEAVE_FORM_MD, llm)
         orch.get_initial_action()
 
-        await orch.process_user_message("Hello")
+        await orch.process_user_message("I need help with this form")
         assert orch.answers == {}
 
 
@@ -317,7 +303,6 @@ class TestLLMExceptions:
 class TestRetryMechanism:
     """Retry logic when first LLM call returns bad JSON."""
 
-    @pytest.mark.asyncio
     async def test_bad_json_then_good_json_succeeds_in_extraction(self):
         """First extraction call returns garbage, retry returns valid JSON."""
         llm = FailThenSucceedLLM(
@@ -338,7 +323,6 @@ class TestRetryMechanism:
         # plus 1 more for conversation phase = 3 total
         assert llm.call_count >= 2
 
-    @pytest.mark.asyncio
     async def test_all_retries_exhausted_during_extraction(self):
         """All extraction retries fail — falls through to conversation (also fails)."""
         llm = FailThenSucceedLLM(
@@ -356,10 +340,37 @@ class TestRetryMechanism:
         assert orch.answers.get("leave_type") is None or orch.answers.get("leave_type") == "X"
 
 
+class TestRetryBackoff:
+    """Exponential backoff schedule between failed LLM calls."""
+
+    @pytest.fixture(autouse=True)
+    def _real_base_delay(self, monkeypatch):
+        # conftest zeroes the base delay for speed; restore a real one
+        monkeypatch.setattr("backend.agent.utils.LLM_RETRY_BASE_DELAY", 0.5)
+
+    @pytest.mark.parametrize("attempt, expected", [
+        (0, 0.5), (1, 1.0), (2, 2.0), (3, 4.0), (4, 8.0), (5, 8.0),
+    ])
+    def test_delay_doubles_up_to_cap(self, monkeypatch, attempt, expected):
+        monkeypatch.setattr("backend.agent.utils.random.uniform", lambda a, b: a)
+        assert _retry_delay(attempt) == expected
+
+    @pytest.mark.parametrize("attempt", [0, 2, 6])
+    def test_jitter_adds_at_most_twenty_percent(self, monkeypatch, attempt):
+        monkeypatch.setattr("backend.agent.utils.random.uniform", lambda a, b: b)
+        base = min(0.5 * 2 ** attempt, 8.0)
+        assert _retry_delay(attempt) == pytest.approx(base * 1.2)
+
+    def test_jitter_stays_in_bounds(self):
+        random.seed(1234)
+        for attempt in range(6):
+            base = min(0.5 * 2 ** attempt, 8.0)
+            assert base <= _retry_delay(attempt) <= base * 1.2
+
+
 class TestReaskHumanization:
     """Invalid-answer retries should avoid verbatim robotic repeats."""
 
-    @pytest.mark.asyncio
     async def test_invalid_reask_is_rephrased_not_verbatim(self):
         """If LLM repeats the same re-ask text, guard should force rephrase."""
         first_question = "When is your leave start date?"
@@ -407,7 +418,6 @@ class TestReaskHumanization:
 class TestPydanticPayloadValidation:
     """LLM JSON payloads are validated via pydantic schemas."""
 
-    @pytest.mark.asyncio
     async def test_missing_required_action_field_retries(self):
         """ASK_TEXT without field_id is rejected and retried."""
         llm = RawTextLLM([
@@ -426,12 +436,31 @@ class TestPydanticPayloadValidation:
         orch = GraphRunner(LEAVE_FORM_MD, llm)
         orch.get_initial_action()
 
-        action = await orch.process_user_message("hello")
+        action = await orch.process_user_message("I need help with this form")
         assert action["action"] == "ASK_TEXT"
         assert action["field_id"] == "leave_type"
         assert llm.call_count >= 3
 
-    @pytest.mark.asyncio
+    async def test_empty_field_id_retries(self):
+        """ASK_TEXT with an empty field_id is rejected like a missing one."""
+        llm = RawTextLLM([
+            json.dumps({"intent": "multi_answer", "answers": {}, "message": "Start"}),
+            json.dumps({"action": "ASK_TEXT", "field_id": "",
+                        "message": "What is your leave type?"}),
+            json.dumps({
+                "action": "ASK_TEXT",
+                "field_id": "leave_type",
+                "label": "Leave type?",
+                "message": "What is your leave type?",
+            }),
+        ])
+        orch = GraphRunner(LEAVE_FORM_MD, llm)
+        orch.get_initial_action()
+
+        action = await orch.process_user_message("I need help with this form")
+        assert action["field_id"] == "leave_type"
+        assert llm.call_count >= 3
+
     async def test_message_payload_accepts_message_only_and_normalizes(self):
         """MESSAGE payload with only 'message' is normalized to include text."""
         llm = RawTextLLM([
@@ -441,6 +470,6 @@ class TestPydanticPayloadValidation:
         orch = GraphRunner(LEAVE_FORM_MD, llm)
         orch.get_initial_action()
 
-        action = await orch.process_user_message("hello")
+        action = await orch.process_user_message("I need help with this form")
         assert action["action"] == "MESSAGE"
         assert action["text"] == "I can help with that."
@@ -12,11 +12,13 @@ Tests cover:
 - Conversation history is maintained
 """
 
-import json
-from unittest.mock import MagicMock
+from collections import deque
+from collections.abc import Sequence
+from types import SimpleNamespace
 
-import pytest
+import orjson
 
+from backend.agent.state import MAX_STORED_HISTORY_MESSAGES, append_history
 from backend.tests.conftest import GraphRunner
 
 
@@ -69,38 +71,35 @@ fields:
 class MockLLM:
     """A mock LLM that returns pre-configured responses.
 
-    Set `responses` to a list of dicts (the JSON the LLM would return).
-    Each call to ainvoke pops the next response.
+    Set `responses` to a sequence of dicts (the JSON the LLM would
+    return). Each response is serialized once up front; each call to
+    ainvoke returns the next pre-serialized string.
     """
 
-    def __init__(self, responses: list[dict] | None = None):
-        self.responses = list(responses or [])
+    def __init__(self, responses: Sequence[dict] = ()):
+        self._json = tuple(orjson.dumps(r).decode() for r in responses)
         self.call_count = 0
 
     async def ainvoke(self, messages, **kwargs):
+        index = self.call_count
         self.call_count += 1
-        if not self.responses:
+        if index >= len(self._json):
             raise RuntimeError("MockLLM has no more responses")
-        response_dict = self.responses.pop(0)
-        result = MagicMock()
-        result.content = json.dumps(response_dict)
-        return result
+        return SimpleNamespace(content=self._json[index])
 
 
 class MockLLMRawText:
     """A mock LLM that returns raw text strings (not necessarily JSON)."""
 
     def __init__(self, responses: list[str]):
-        self.responses = list(responses)
+        self.responses = deque(responses)
         self.call_count = 0
 
     async def ainvoke(self, messages, **kwargs):
         self.call_count += 1
         if not self.responses:
             raise RuntimeError("MockLLMRawText has no more responses")
-        result = MagicMock()
-        result.content = self.responses.pop(0)
-        return result
+        return SimpleNamespace(content=self.responses.popleft())
 
 
 class MockLLMError:
@@ -114,6 +113,11 @@ class MockLLMError:
         raise Exception("LLM connection failed")
 
 
+# Shared mock for tests that never reach the LLM. It has no responses,
+# so an unexpected call still fails loudly.
+_NOOP_LLM = MockLLM()
+
+
 # =============================================================
 # Test: Initial action (greeting MESSAGE)
 # =============================================================
@@ -124,8 +128,7 @@ class TestInitialAction:
 
     def test_returns_greeting_message(self):
         """Initial action is a MESSAGE asking user to describe all data."""
-        llm = MockLLM()
-        runner = GraphRunner(SIMPLE_FORM_MD, llm)
+        runner = GraphRunner(SIMPLE_FORM_MD, _NOOP_LLM)
 
         action = runner.get_initial_action()
         assert action["action"] == "MESSAGE"
@@ -133,8 +136,7 @@ class TestInitialAction:
         assert "FormPilot AI" in action["text"]
 
     def test_records_in_conversation_history(self):
-        llm = MockLLM()
-        runner = GraphRunner(SIMPLE_FORM_MD, llm)
+        runner = GraphRunner(SIMPLE_FORM_MD, _NOOP_LLM)
 
         runner.get_initial_action()
         assert len(runner.conversation_history) == 1
@@ -149,7 +151,6 @@ class TestInitialAction:
 class TestExtractionPhase:
     """Tests for the bulk extraction phase."""
 
-    @pytest.mark.asyncio
     async def test_extracts_answers_from_multi_answer(self):
         """Extraction captures answers and stores them."""
         llm = MockLLM([
@@ -165,7 +166,6 @@ class TestExtractionPhase:
         assert orch.answers["name"] == "Alice"
         assert orch.answers["color"] == "Blue"
 
-    @pytest.mark.asyncio
     async def test_empty_extraction_falls_through(self):
         """Empty extraction results → falls through to conversation phase."""
         llm = MockLLM([
@@ -177,11 +177,23 @@ class TestExtractionPhase:
         ])
         orch = GraphRunner(SIMPLE_FORM_MD, llm)
 
-        result = await orch.process_user_message("hello")
+        result = await orch.process_user_message("I need help with this form")
         assert result["action"] == "ASK_TEXT"
         assert result["field_id"] == "name"
 
-    @pytest.mark.asyncio
+    async def test_greeting_skips_extraction_call(self):
+        """A bare greeting goes straight to the conversation phase."""
+        llm = MockLLM([
+            {"action": "ASK_TEXT", "field_id": "name", "label": "What is your name?",
+             "message": "Let's start with your name."},
+        ])
+        orch = GraphRunner(SIMPLE_FORM_MD, llm)
+
+        result = await orch.process_user_message("Hello!")
+        assert result["field_id"] == "name"
+        assert llm.call_count == 1
+        assert orch._initial_extraction_done is True
+
     async def test_extraction_marks_done(self):
         """After extraction, subsequent messages go to conversation phase."""
         llm = MockLLM([
@@ -215,7 +227,6 @@ class TestExtractionPhase:
 class TestConversationPhase:
     """Tests for the LLM-driven conversation phase."""
 
-    @pytest.mark.asyncio
     async def test_ask_text_action(self):
         """LLM returns ASK_TEXT action after extraction."""
         llm = MockLLM([
@@ -230,11 +241,10 @@ class TestConversationPhase:
         orch = GraphRunner(SIMPLE_FORM_MD, llm)
 
         # First message triggers extraction + conversation
-        result = await orch.process_user_message("hi")
+        result = await orch.process_user_message("I need help with this form")
         assert result["action"] == "ASK_TEXT"
         assert result["field_id"] == "name"
 
-    @pytest.mark.asyncio
     async def test_ask_dropdown_with_options(self):
         """LLM returns ASK_DROPDOWN with options."""
         llm = MockLLM([
@@ -250,7 +260,6 @@ class TestConversationPhase:
         assert result["action"] == "ASK_DROPDOWN"
         assert result["options"] == ["Red", "Blue", "Green"]
 
-    @pytest.mark.asyncio
     async def test_form_complete(self):
         """LLM returns FORM_COMPLETE."""
         llm = MockLLM([
@@ -266,7 +275,6 @@ class TestConversationPhase:
         assert result["action"] == "FORM_COMPLETE"
         assert result["data"]["name"] == "Alice"
 
-    @pytest.mark.asyncio
     async def test_form_complete_populates_data_from_answers(self):
         """If LLM returns FORM_COMPLETE without data, answers are used."""
         llm = MockLLM([
@@ -290,7 +298,6 @@ class TestConversationPhase:
 class TestToolCallRoundTrip:
     """Test TOOL_CALL action and tool result handling."""
 
-    @pytest.mark.asyncio
     async def test_tool_call_returned_to_frontend(self):
         """LLM can request a TOOL_CALL action."""
         llm = MockLLM([
@@ -305,7 +312,6 @@ class TestToolCallRoundTrip:
         assert result["action"] == "TOOL_CALL"
         assert result["tool_name"] == "get_options"
 
-    @pytest.mark.asyncio
     async def test_tool_results_sent_back_to_llm(self):
         """Tool results are sent back and LLM continues the conversation."""
         llm = MockLLM([
@@ -336,7 +342,6 @@ class TestToolCallRoundTrip:
         assert r2["action"] == "ASK_DROPDOWN"
         assert "Company A" in r2["options"]
 
-    @pytest.mark.asyncio
     async def test_tool_results_added_to_history(self):
         """Tool results should appear in conversation history."""
         llm = MockLLM([
@@ -371,7 +376,6 @@ class TestToolCallRoundTrip:
 class TestLLMJsonFailure:
     """Test behavior when LLM returns invalid JSON or fails entirely."""
 
-    @pytest.mark.asyncio
     async def test_invalid_json_then_valid_retry(self):
         llm = MockLLMRawText([
             # Extraction phase — invalid JSON then valid retry
@@ -382,11 +386,10 @@ class TestLLMJsonFailure:
         ])
         orch = GraphRunner(SIMPLE_FORM_MD, llm)
 
-        result = await orch.process_user_message("hello")
+        result = await orch.process_user_message("I need help with this form")
         assert result["action"] == "ASK_TEXT"
         assert llm.call_count >= 2  # At least extraction retry + conversation
 
-    @pytest.mark.asyncio
     async def test_all_retries_fail_returns_message(self):
         llm = MockLLMRawText([
             "not json 1",
@@ -399,20 +402,18 @@ class TestLLMJsonFailure:
         ])
         orch = GraphRunner(SIMPLE_FORM_MD, llm)
 
-        result = await orch.process_user_message("hello")
+        result = await orch.process_user_message("I need help with this form")
         assert result["action"] == "MESSAGE"
         assert "trouble" in result["text"]
 
-    @pytest.mark.asyncio
     async def test_llm_exception_returns_fallback(self):
         llm = MockLLMError()
         orch = GraphRunner(SIMPLE_FORM_MD, llm)
 
-        result = await orch.process_user_message("hello")
+        result = await orch.process_user_message("I need help with this form")
         assert result["action"] == "MESSAGE"
         assert "trouble" in result["text"]
 
-    @pytest.mark.asyncio
     async def test_json_in_markdown_fence_extracted(self):
         llm = MockLLMRawText([
             '```json\n{"intent": "multi_answer", "answers": {"name": "Alice"}, "message": "Got it!"}\n```',
@@ -432,7 +433,6 @@ class TestLLMJsonFailure:
 class TestConversationHistory:
     """Test that conversation history is maintained."""
 
-    @pytest.mark.asyncio
     async def test_messages_recorded(self):
         llm = MockLLM([
             {"intent": "multi_answer", "answers": {"name": "Alice"},
@@ -449,16 +449,13 @@ class TestConversationHistory:
         assert "user" in roles
         assert "assistant" in roles
 
-    @pytest.mark.asyncio
     async def test_initial_action_recorded(self):
-        llm = MockLLM()
-        orch = GraphRunner(SIMPLE_FORM_MD, llm)
+        orch = GraphRunner(SIMPLE_FORM_MD, _NOOP_LLM)
 
         orch.get_initial_action()
         assert len(orch.conversation_history) == 1
         assert orch.conversation_history[0]["role"] == "assistant"
 
-    @pytest.mark.asyncio
     async def test_history_grows_with_turns(self):
         llm = MockLLM([
             {"intent": "multi_answer", "answers": {},
@@ -475,55 +472,150 @@ class TestConversationHistory:
         # After initial: 1 entry
         assert len(orch.conversation_history) == 1
 
-        await orch.process_user_message("hello")
+        await orch.process_user_message("I need help with this form")
         # user + extraction msg + conversation msg
         assert len(orch.conversation_history) >= 3
 
         await orch.process_user_message("Alice")
         assert len(orch.conversation_history) >= 5
 
+    def test_history_reducer_keeps_most_recent_entries(self):
+        existing = [
+            {"role": "user", "content": str(i)}
+            for i in range(MAX_STORED_HISTORY_MESSAGES)
+        ]
+        update = [{"role": "assistant", "content": "latest"}]
+
+        history = append_history(existing, update)
+        assert len(history) == MAX_STORED_HISTORY_MESSAGES
+        assert history[0]["content"] == "1"
+        assert history[-1]["content"] == "latest"
+
 
 # =============================================================
 # Test: Answer tracking
 # =============================================================
 
 
+_RESP_ALL_ANSWERS_THEN_COMPLETE = (
+    {"intent": "multi_answer", "answers": {"name": "Bob", "color": "Red"},
+     "message": "All captured."},
+    {"action": "FORM_COMPLETE", "data": {"name": "Bob", "color": "Red"},
+     "message": "Done!"},
+)
+
+_RESP_NAME_THEN_ASK_COLOR = (
+    {"intent": "multi_answer", "answers": {"name": "Alice"},
+     "message": "Got name."},
+    {"action": "ASK_DROPDOWN", "field_id": "color",
+     "label": "Color?", "options": ["Red", "Blue", "Green"],
+     "message": "Color?"},
+)
+
+
 class TestAnswerTracking:
     """Test that answers are tracked across turns."""
 
-    @pytest.mark.asyncio
     async def test_answers_from_extraction(self):
-        llm = MockLLM([
-            {"intent": "multi_answer", "answers": {"name": "Bob", "color": "Red"},
-             "message": "All captured."},
-            {"action": "FORM_COMPLETE", "data": {"name": "Bob", "color": "Red"},
-             "message": "Done!"},
-        ])
+        llm = MockLLM(_RESP_ALL_ANSWERS_THEN_COMPLETE)
         orch = GraphRunner(SIMPLE_FORM_MD, llm)
 
         await orch.process_user_message("Bob, Red")
         assert orch.get_answers() == {"name": "Bob", "color": "Red"}
 
-    @pytest.mark.asyncio
     async def test_answers_accumulate_across_turns(self):
-        llm = MockLLM([
+        llm = MockLLM(_RESP_NAME_THEN_ASK_COLOR)
+        orch = GraphRunner(SIMPLE_FORM_MD, llm)
+
+        await orch.process_user_message("Alice")
+        assert "name" in orch.get_answers()
+        assert orch.get_answers()["name"] == "Alice"
+
+
+# =============================================================
+# Test: Dropdown answer validation
+# =============================================================
+
+
+class TestDropdownValidation:
+    """Dropdown replies matching an option are normalized to its casing."""
+
+    def _llm(self, *extra):
+        return MockLLM([
             {"intent": "multi_answer", "answers": {"name": "Alice"},
              "message": "Got name."},
             {"action": "ASK_DROPDOWN", "field_id": "color",
              "label": "Color?", "options": ["Red", "Blue", "Green"],
-             "message": "Color?"},
+             "message": "What is your favorite color?"},
+            *extra,
         ])
+
+    async def test_option_matched_case_insensitively(self):
+        llm = self._llm(
+            {"action": "FORM_COMPLETE", "message": "All done!"},
+        )
         orch = GraphRunner(SIMPLE_FORM_MD, llm)
 
-        await orch.process_user_message("Alice")
-        assert "name" in orch.get_answers()
-        assert orch.get_answers()["name"] == "Alice"
+        await orch.process_user_message("My name is Alice")
+        result = await orch.process_user_message("blue")
+        assert orch.answers["color"] == "Blue"
+        assert result["action"] == "FORM_COMPLETE"
+
+    async def test_unmatched_reply_is_stored_verbatim(self):
+        llm = self._llm(
+            {"action": "FORM_COMPLETE", "message": "All done!"},
+        )
+        orch = GraphRunner(SIMPLE_FORM_MD, llm)
+
+        await orch.process_user_message("My name is Alice")
+        result = await orch.process_user_message("أحمر")
+        assert orch.answers["color"] == "أحمر"
+        assert result["action"] == "FORM_COMPLETE"
+        assert not any(
+            "INVALID" in str(msg.get("content", ""))
+            for msg in orch.conversation_history
+        )
+
+
+# =============================================================
+# Test: Form already complete
+# =============================================================
+
+
+class TestFormAlreadyComplete:
+    """Turns without new input after completion replay the result."""
+
+    async def test_returns_complete_when_already_done(self):
+        llm = MockLLM(_RESP_ALL_ANSWERS_THEN_COMPLETE)
+        orch = GraphRunner(SIMPLE_FORM_MD, llm)
+
+        completed = await orch.process_user_message("Bob, Red")
+        assert completed["action"] == "FORM_COMPLETE"
+
+        result = await orch.process_user_message("")
+        assert result == completed
+        assert llm.call_count == 2
+
+    async def test_new_message_after_completion_reaches_llm(self):
+        llm = MockLLM([
+            {"intent": "multi_answer", "answers": {"name": "Bob", "color": "Red"},
+             "message": "All captured."},
+            {"action": "FORM_COMPLETE", "data": {"name": "Bob", "color": "Red"},
+             "message": "Done!"},
+            {"action": "FORM_COMPLETE", "data": {"name": "Bob", "color": "Red"},
+             "message": "Still all set!"},
+        ])
+        orch = GraphRunner(SIMPLE_FORM_MD, llm)
+
+        await orch.process_user_message("Bob, Red")
+        result = await orch.process_user_message("Is that everything?")
+        assert result["message"] == "Still all set!"
+        assert llm.call_count == 3
 
 
 class TestStepConfirmationFlow:
     """Multi-step forms require user confirmation between steps."""
 
-    @pytest.mark.asyncio
     async def test_step_summary_then_confirm_to_next_step(self):
         llm = MockLLM([
             {"intent": "multi_answer", "answers": {}, "message": "Let's start."},
@@ -539,7 +631,7 @@ class TestStepConfirmationFlow:
         orch = GraphRunner(STEP_FORM_MD, llm)
         orch.get_initial_action()
 
-        r1 = await orch.process_user_message("hi")
+        r1 = await orch.process_user_message("I need help with this form")
         assert r1["action"] == "ASK_TEXT"
         assert r1["field_id"] == "name"
 
@@ -552,7 +644,6 @@ class TestStepConfirmationFlow:
         assert r3["action"] == "ASK_TEXT"
         assert r3["field_id"] == "reason"
 
-    @pytest.mark.asyncio
     async def test_user_can_request_update_before_confirming_step(self):
         llm = MockLLM([
             {"intent": "multi_answer", "answers": {}, "message": "Let's start."},
@@ -568,7 +659,7 @@ class TestStepConfirmationFlow:
         orch = GraphRunner(STEP_FORM_MD, llm)
         orch.get_initial_action()
 
-        await orch.process_user_message("hi")
+        await orch.process_user_message("I need help with this form")
         summary = await orch.process_user_message("Alice")
         assert summary["action"] == "MESSAGE"
         assert "Step 1 is complete" in summary["text"]